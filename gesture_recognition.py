@@ -1,6 +1,17 @@
 import cv2
 import mediapipe as mp
+import numpy as np
+import os
+import queue
+import threading
 import time
+from mediapipe.tasks import python as mp_tasks
+from mediapipe.tasks.python import vision
+
+try:
+    from numba import njit
+except ImportError:  # Numba bersifat opsional
+    njit = None
 
 # ==============================================================================
 # INSTRUKSI INSTALASI LIBRARY
@@ -8,32 +19,231 @@ import time
 # Sebelum menjalankan program ini, pastikan Anda telah menginstal library yang dibutuhkan.
 # Buka terminal atau command prompt dan jalankan perintah berikut:
 #
-# pip install opencv-python mediapipe
+# pip install opencv-python mediapipe numpy
+#
+# Opsional, untuk mempercepat deteksi jari dengan kompilasi JIT:
+#
+# pip install numba
+#
+# Deteksi tangan memakai MediaPipe Tasks (HandLandmarker) yang membutuhkan file model.
+# Unduh file berikut dan letakkan di folder yang sama dengan program ini:
+#
+# https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/latest/hand_landmarker.task
 #
 # ==============================================================================
 
+# Lokasi file model HandLandmarker
+HAND_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hand_landmarker.task")
+
+# Jumlah thread internal OpenCV (resize, cvtColor, menggambar). Sisa core dibiarkan
+# untuk thread pool XNNPACK milik MediaPipe dan thread capture webcam.
+OPENCV_NUM_THREADS = 2
+
+# ID landmarks ujung jari (Tip): Jempol 4, Telunjuk 8, Tengah 12, Manis 16, Kelingking 20.
+# Dipakai bersama oleh `finger_key_jit` dan `GestureRecognitionApp` agar keduanya selalu sama.
+TIP_IDS = (4, 8, 12, 16, 20)
+
+if njit is not None:
+    @njit(cache=True)
+    def finger_key_jit(lm, is_right):
+        """
+        Versi Numba dari logika `GestureRecognitionApp.detect_fingers`.
+
+        Args:
+            lm (np.ndarray): Array koordinat piksel landmarks (21, 2).
+            is_right (bool): True jika tangan kanan.
+
+        Returns:
+            int: Status 5 jari dikemas sebagai integer 5-bit.
+        """
+        # Perbandingan jempol ketat untuk kedua tangan: x yang sama berarti tertutup
+        thumb_tip = TIP_IDS[0]
+        if is_right:
+            thumb = lm[thumb_tip, 0] < lm[thumb_tip - 1, 0]
+        else:
+            thumb = lm[thumb_tip, 0] > lm[thumb_tip - 1, 0]
+        key = 16 if thumb else 0
+        for i in range(4):
+            tip = TIP_IDS[i + 1]
+            if lm[tip, 1] < lm[tip - 2, 1]:
+                key |= 8 >> i
+        return key
+else:
+    finger_key_jit = None
+
+
+class FrameGrabber(threading.Thread):
+    """
+    Thread terpisah yang membaca frame webcam, mem-flip, dan mengonversinya ke RGB,
+    sehingga proses capture/decode berjalan paralel dengan inferensi MediaPipe.
+
+    Frame RGB untuk MediaPipe diperkecil ke lebar `inference_width` (rasio aspek
+    dipertahankan), sedangkan frame BGR resolusi penuh tetap dipakai untuk menggambar.
+    Koordinat hasil MediaPipe bersifat relatif (0.0 - 1.0) sehingga tetap cocok.
+
+    Hanya frame terbaru yang disimpan (queue berukuran 1); frame lama yang belum
+    sempat diproses akan dibuang.
+    """
+
+    def __init__(self, cap, inference_width=320):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.inference_width = inference_width
+        self.frames = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+
+    def run(self):
+        # Simpan fungsi/konstanta cv2 di variabel lokal agar tidak di-lookup tiap frame
+        read = self.cap.read
+        flip = cv2.flip
+        resize = cv2.resize
+        cvt_color = cv2.cvtColor
+        INTER_AREA = cv2.INTER_AREA
+        BGR2RGB = cv2.COLOR_BGR2RGB
+        stopped = self._stop_event.is_set
+
+        # Apa pun penyebab thread berhenti (webcam gagal dibaca, error, atau stop()),
+        # selalu kirim None agar loop utama tidak menunggu frame selamanya
+        try:
+            while not stopped():
+                success, img = read()
+                if not success:
+                    break
+
+                # Flip gambar secara horizontal agar seperti cermin (opsional, tapi lebih natural)
+                img = flip(img, 1)
+
+                # Perkecil frame untuk inferensi; biaya model sebanding dengan jumlah piksel.
+                # Konversi BGR ke RGB karena MediaPipe membutuhkan input RGB.
+                h, w = img.shape[:2]
+                if w > self.inference_width:
+                    size = (self.inference_width, round(h * self.inference_width / w))
+                    img_rgb = resize(img, size, interpolation=INTER_AREA)
+                    # Hasil resize adalah buffer baru milik frame ini, jadi aman dikonversi
+                    # di tempat (tanpa alokasi array baru)
+                    cvt_color(img_rgb, BGR2RGB, dst=img_rgb)
+                else:
+                    # `img` masih dipakai untuk ditampilkan, jadi perlu buffer terpisah
+                    img_rgb = cvt_color(img, BGR2RGB)
+
+                self._put((img, img_rgb))
+        finally:
+            self._put(None)
+
+    def _put(self, item):
+        # Buang frame lama yang belum diambil agar queue selalu berisi frame terbaru
+        try:
+            self.frames.get_nowait()
+        except queue.Empty:
+            pass
+        self.frames.put_nowait(item)
+
+    def read(self):
+        """
+        Mengambil frame terbaru (menunggu jika belum ada).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray] | None: Pasangan (img BGR resolusi penuh,
+            img RGB kecil untuk inferensi), atau None jika thread capture sudah berhenti
+            (webcam gagal dibaca atau terjadi error).
+        """
+        return self.frames.get()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=1.0)
+
+
 class GestureRecognitionApp:
-    def __init__(self):
+    # ID landmarks ujung jari (Tip), lihat TIP_IDS di level modul
+    TIP_IDS = TIP_IDS
+    # Ujung jari (Tip) dan sendi tengah (PIP = Tip - 2) untuk Telunjuk s/d Kelingking
+    FINGER_TIP_IDS = np.array(TIP_IDS[1:])
+    FINGER_PIP_IDS = FINGER_TIP_IDS - 2
+    # Bobot bit untuk mengemas status 4 jari menjadi satu integer (Telunjuk = bit 3)
+    FINGER_BITS = np.array([8, 4, 2, 1])
+
+    # Pengaturan teks nama gesture
+    TEXT_MAX_WIDTH = 200  # Lebar maksimum teks sebelum turun baris
+    TEXT_FONT_SCALE = 0.8
+    TEXT_THICKNESS = 2
+    TEXT_LINE_HEIGHT = 30
+
+    # Set False untuk tidak menggambar landmarks tangan sama sekali
+    draw_landmarks = True
+    # Set True untuk menampilkan status jari (debug info) di bawah tiap tangan
+    debug = False
+
+    # Selisih minimal (0-255) agar satu piksel thumbnail dianggap berubah
+    MOTION_PIXEL_DIFF = 25
+    # Porsi piksel berubah minimal agar frame dianggap bergerak (0.5%, kira-kira satu jari)
+    MOTION_MIN_CHANGED = 0.005
+    # Inferensi tetap dijalankan paling lambat setiap sekian frame, sehingga hasil yang
+    # dipakai ulang tidak pernah tertinggal lebih dari jumlah frame ini
+    MOTION_MAX_SKIPPED = 10
+    # Ukuran thumbnail untuk mendeteksi gerakan
+    MOTION_SIZE = (64, 48)
+
+    # Lebar frame untuk deteksi wajah; model wajah bekerja pada input kecil
+    FACE_INFERENCE_WIDTH = 192
+
+    def __init__(self, max_hands=1, enable_face=False):
         """
         Inisialisasi konfigurasi MediaPipe dan variabel gesture.
+
+        Args:
+            max_hands (int): Jumlah maksimum tangan yang dideteksi. Default 1 karena
+                             mencari lebih banyak tangan menambah kerja palm detector.
+            enable_face (bool): Aktifkan deteksi wajah. Default False karena hasilnya
+                                hanya digambar sebagai kotak dan tidak dipakai logika gesture.
         """
-        # Inisialisasi MediaPipe Hands
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        # Batasi thread OpenCV sebelum model MediaPipe dibuat, agar kedua thread pool
+        # tidak berebut core yang sama
+        cv2.setNumThreads(OPENCV_NUM_THREADS)
 
-        # Inisialisasi MediaPipe Face Detection
-        self.mp_face_detection = mp.solutions.face_detection
-        self.face_detection = self.mp_face_detection.FaceDetection(
-            min_detection_confidence=0.5
+        # Inisialisasi MediaPipe HandLandmarker (Tasks API) dalam mode LIVE_STREAM.
+        # detect_async() langsung kembali; hasilnya dikirim ke `_on_hands` dari thread MediaPipe,
+        # sehingga deteksi tangan berjalan paralel dengan deteksi wajah dan menggambar.
+        if not os.path.exists(HAND_MODEL_PATH):
+            raise FileNotFoundError(
+                f"File model tidak ditemukan: {HAND_MODEL_PATH}. "
+                "Lihat instruksi instalasi di bagian atas file ini."
+            )
+        # Pasangan indeks landmark untuk garis penghubung tangan, array (jumlah koneksi, 2)
+        self._hand_edges = np.array(
+            [(c.start, c.end) for c in vision.HandLandmarksConnections.HAND_CONNECTIONS],
+            dtype=np.int32
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(
+            vision.HandLandmarkerOptions(
+                base_options=mp_tasks.BaseOptions(model_asset_path=HAND_MODEL_PATH),
+                running_mode=vision.RunningMode.LIVE_STREAM,
+                num_hands=max_hands,
+                min_hand_detection_confidence=0.5,
+                min_hand_presence_confidence=0.5,
+                min_tracking_confidence=0.5,
+                result_callback=self._on_hands
+            )
         )
+        # Hasil deteksi tangan terakhir dan timestamp frame terakhir yang dikirim (ms)
+        self._hand_result = None
+        self._last_timestamp_ms = -1
 
-        # Utilitas menggambar (untuk bounding box dan landmarks)
-        self.mp_draw = mp.solutions.drawing_utils
+        # Inisialisasi MediaPipe Face Detection (hanya jika diaktifkan)
+        self.enable_face = enable_face
+        self.face_detection = None
+        if enable_face:
+            self.mp_face_detection = mp.solutions.face_detection
+            self.face_detection = self.mp_face_detection.FaceDetection(
+                min_detection_confidence=0.5
+            )
+        # Hasil deteksi wajah terakhir, dipakai ulang saat frame tidak bergerak
+        self._face_results = None
+
+        # Thumbnail frame terakhir yang diproses MediaPipe (untuk deteksi gerakan)
+        # dan jumlah frame berturut-turut yang inferensinya dilewati
+        self._prev_small = None
+        self._skipped_frames = 0
 
         # ==========================================================================
         # KONFIGURASI GESTURE (MAPPING)
@@ -42,7 +252,7 @@ class GestureRecognitionApp:
         # 1 = Terangkat/Terbuka, 0 = Tertutup/Ditekuk
         # Anda bisa mengubah atau menambahkan aturan gesture di sini.
         self.gesture_map = {
-            (1, 1, 1, 1, 1): "Kepalan Tangan (Fist)",
+            (0, 0, 0, 0, 0): "Kepalan Tangan (Fist)",
             (1, 0, 0, 0, 0): "Mantap",
             (0, 1, 0, 0, 0): "Nama Saya",
             (0, 1, 1, 0, 0): "Ersaf Sirazi Arifin",
@@ -54,74 +264,214 @@ class GestureRecognitionApp:
             (0, 0, 1, 0, 0): "NGENTOT LO ANJING TAI BANGSAT",
         }
 
-    def detect_fingers(self, hand_landmarks, handedness_label):
+        # Kompilasi finger_key_jit sekarang agar frame pertama tidak menunggu JIT
+        if finger_key_jit is not None:
+            finger_key_jit(np.zeros((21, 2), dtype=np.int16), True)
+
+        # Tabel 32 entri yang diindeks langsung dengan key 5-bit (lihat `pack_fingers`)
+        self.gesture_table = ["Unknown Gesture"] * 32
+        for fingers, name in self.gesture_map.items():
+            self.gesture_table[self.pack_fingers(fingers)] = name
+
+        # Teks debug status jari untuk setiap key 5-bit, contoh "10100"
+        self._dbg_strs = [format(key, '05b') for key in range(32)]
+
+        # Cache hasil text wrapping per teks gesture; semua gesture sudah dihitung di awal
+        self._wrap_cache = {}
+        for name in set(self.gesture_table):
+            self._wrap(name)
+
+    @staticmethod
+    def pack_fingers(fingers):
+        """
+        Mengemas tuple status jari menjadi integer 5-bit.
+
+        Args:
+            fingers (Tuple[int]): Status jari (Jempol, Telunjuk, Tengah, Manis, Kelingking).
+
+        Returns:
+            int: Jempol di bit 4, Telunjuk di bit 3, ..., Kelingking di bit 0.
+        """
+        t, i, m, a, k = fingers
+        return (t << 4) | (i << 3) | (m << 2) | (a << 1) | k
+
+    def _on_hands(self, result, output_image, timestamp_ms):
+        """
+        Callback HandLandmarker (dipanggil dari thread MediaPipe): simpan hasil terbaru.
+        """
+        self._hand_result = result
+
+    def _next_timestamp_ms(self):
+        # detect_async() mewajibkan timestamp yang selalu naik
+        self._last_timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        return self._last_timestamp_ms
+
+    @staticmethod
+    def landmarks_to_array(hand_landmarks, w, h):
+        """
+        Menyalin koordinat (x, y) 21 landmarks tangan ke dalam satu array NumPy
+        dan mengubahnya menjadi koordinat piksel integer.
+
+        Koordinat cukup disalin sekali per tangan lalu dipakai ulang
+        untuk logika jari, posisi teks, maupun untuk menggambar.
+
+        Karena dibulatkan ke piksel, dua landmark lebih sering berada di kolom/baris
+        yang sama (contoh: jempol tegak lurus). Logika jari memakai perbandingan ketat,
+        sehingga posisi yang sama selalu dianggap jari tertutup.
+
+        Args:
+            hand_landmarks: List 21 NormalizedLandmark dari HandLandmarker.
+            w (int): Lebar frame tujuan (piksel).
+            h (int): Tinggi frame tujuan (piksel).
+
+        Returns:
+            np.ndarray: Array int16 berukuran (21, 2) berisi koordinat piksel (x, y).
+        """
+        lm = np.fromiter(
+            (v for p in hand_landmarks for v in (p.x, p.y)),
+            dtype=np.float32, count=42
+        ).reshape(21, 2)
+        return (lm * np.array([w, h], dtype=np.float32)).astype(np.int16)
+
+    def draw_hands(self, img, hands_lm):
+        """
+        Menggambar landmarks dan garis penghubung untuk semua tangan.
+
+        Semua garis penghubung digambar dengan satu panggilan `cv2.polylines`, begitu juga
+        semua titik landmark (sebagai polyline tertutup satu titik, yang tergambar sebagai bulatan).
+
+        Args:
+            img (np.ndarray): Frame BGR tujuan.
+            hands_lm (List[np.ndarray]): Array koordinat piksel landmarks (21, 2) per tangan.
+        """
+        # cv2.polylines membutuhkan titik bertipe int32
+        pts = np.stack(hands_lm).astype(np.int32)
+        # (jumlah tangan, jumlah koneksi, 2 titik, xy) -> daftar segmen garis
+        segments = pts[:, self._hand_edges].reshape(-1, 2, 2)
+        cv2.polylines(img, segments, False, (224, 224, 224), 2)
+        cv2.polylines(img, pts.reshape(-1, 1, 2), True, (0, 0, 255), 6)
+
+    def detect_fingers(self, lm, handedness_label):
         """
         Mendeteksi status setiap jari (terbuka/tertutup).
         
         Args:
-            hand_landmarks: Objek landmarks dari MediaPipe.
+            lm (np.ndarray): Array koordinat piksel landmarks (21, 2) dari `landmarks_to_array`.
             handedness_label: Label tangan ('Left' atau 'Right').
             
         Returns:
-            List[int]: Status 5 jari [Jempol, Telunjuk, Tengah, Manis, Kelingking]
-                       1 jika terbuka, 0 jika tertutup.
+            int: Status 5 jari dikemas sebagai integer 5-bit (lihat `pack_fingers`),
+                 bit bernilai 1 jika jari terbuka, 0 jika tertutup.
         """
-        fingers = []
-        
-        # ID Landmarks ujung jari (Tip)
-        # Jempol: 4, Telunjuk: 8, Tengah: 12, Manis: 16, Kelingking: 20
-        tip_ids = [4, 8, 12, 16, 20]
+        # Pakai versi Numba jika tersedia (logikanya sama dengan di bawah)
+        if finger_key_jit is not None:
+            return finger_key_jit(lm, handedness_label == 'Right')
 
         # --- Logika Jempol (Thumb) ---
         # Jempol bergerak menyamping, bukan ke atas/bawah seperti jari lain.
-        # Kita membandingkan posisi x ujung jempol (4) dengan pangkal jempol (3 atau 2).
+        # Kita membandingkan posisi x ujung jempol (4) dengan pangkal jempol (3).
         # Perlu memperhatikan tangan kiri vs kanan.
         
         # Catatan: MediaPipe menganggap 'Left' adalah tangan kiri subjek.
         # Namun pada mode selfie (kamera depan), gambar seringkali di-mirror.
         # Logika di bawah mengasumsikan gambar tidak di-flip kembali secara manual (standar webcam).
         
+        # Kedua perbandingan sengaja ketat (< dan >): jika x ujung jempol sama dengan x sendi,
+        # jempol dianggap tertutup untuk tangan kiri maupun kanan.
+        thumb_tip = self.TIP_IDS[0]
         if handedness_label == 'Right':
             # Untuk tangan kanan, jika ujung jempol lebih ke kiri (x lebih kecil) dari sendi, maka terbuka
-            if hand_landmarks.landmark[tip_ids[0]].x < hand_landmarks.landmark[tip_ids[0] - 1].x:
-                fingers.append(1)
-            else:
-                fingers.append(0)
+            thumb = lm[thumb_tip, 0] < lm[thumb_tip - 1, 0]
         else:
             # Untuk tangan kiri, jika ujung jempol lebih ke kanan (x lebih besar) dari sendi, maka terbuka
-            if hand_landmarks.landmark[tip_ids[0]].x > hand_landmarks.landmark[tip_ids[0] - 1].x:
-                fingers.append(1)
-            else:
-                fingers.append(0)
+            thumb = lm[thumb_tip, 0] > lm[thumb_tip - 1, 0]
 
         # --- Logika 4 Jari Lainnya (Telunjuk s/d Kelingking) ---
         # Jari dianggap terbuka jika posisi y ujung jari (tip) lebih tinggi (nilai y lebih kecil)
         # daripada posisi y sendi tengah (pip - landmark id dikurangi 2).
-        # Koordinat Y pada gambar: 0 di atas, 1 di bawah. Jadi y_tip < y_pip berarti jari naik.
-        
-        for id in range(1, 5):
-            if hand_landmarks.landmark[tip_ids[id]].y < hand_landmarks.landmark[tip_ids[id] - 2].y:
-                fingers.append(1)
-            else:
-                fingers.append(0)
+        # Koordinat Y pada gambar: 0 di atas, makin besar makin ke bawah. Jadi y_tip < y_pip berarti jari naik.
+        # Keempat jari dibandingkan sekaligus dalam satu operasi vektor.
+        open_y = lm[self.FINGER_TIP_IDS, 1] < lm[self.FINGER_PIP_IDS, 1]
 
-        return fingers
+        return (int(thumb) << 4) | int(open_y @ self.FINGER_BITS)
 
     def detect_gesture(self, fingers):
         """
-        Mencocokkan kombinasi jari dengan dictionary gesture.
+        Mencocokkan kombinasi jari dengan tabel gesture.
         
         Args:
-            fingers (List[int]): List status jari, contoh [1, 0, 0, 0, 0]
+            fingers (int): Status jari 5-bit, contoh 0b10000 untuk (1, 0, 0, 0, 0)
             
         Returns:
             str: Nama gesture atau "Unknown Gesture" jika tidak dikenali.
         """
-        # Ubah list ke tuple agar bisa dijadikan key dictionary
-        finger_tuple = tuple(fingers)
+        # Entri yang tidak ada di gesture_map berisi "Unknown Gesture"
+        return self.gesture_table[fingers]
+
+    def _wrap(self, text):
+        """
+        Memecah teks menjadi beberapa baris agar lebarnya tidak melebihi TEXT_MAX_WIDTH.
+
+        Hasilnya disimpan di cache karena teks gesture berasal dari himpunan yang tetap.
+
+        Args:
+            text (str): Teks yang akan dipecah.
+
+        Returns:
+            List[str]: Baris-baris teks.
+        """
+        lines = self._wrap_cache.get(text)
+        if lines is not None:
+            return lines
+
+        words = text.split(' ')
+        lines = []
+        current_line = ""
         
-        # Ambil dari dictionary, default ke "Unknown" jika tidak ada
-        return self.gesture_map.get(finger_tuple, "Unknown Gesture")
+        for word in words:
+            test_line = current_line + word + " "
+            (text_w, text_h), _ = cv2.getTextSize(
+                test_line, cv2.FONT_HERSHEY_SIMPLEX, self.TEXT_FONT_SCALE, self.TEXT_THICKNESS
+            )
+            if text_w > self.TEXT_MAX_WIDTH and current_line != "":
+                lines.append(current_line.strip())
+                current_line = word + " "
+            else:
+                current_line = test_line
+        lines.append(current_line.strip())
+
+        self._wrap_cache[text] = lines
+        return lines
+
+    def _has_motion(self, img_rgb):
+        """
+        Mengecek apakah frame berbeda cukup jauh dari frame terakhir yang diproses MediaPipe.
+
+        Yang dihitung adalah jumlah piksel yang berubah, bukan rata-rata selisih seluruh
+        frame, agar perubahan kecil seperti satu jari yang ditekuk tetap terdeteksi.
+        Thumbnail acuan hanya diperbarui saat inferensi dijalankan, sehingga gerakan lambat
+        yang terakumulasi selama beberapa frame tetap terdeteksi. Inferensi juga dipaksa
+        setiap MOTION_MAX_SKIPPED frame, karena detect_async() bisa membuang frame terakhir
+        sebelum gambar diam dan hasilnya akan tertinggal selamanya.
+
+        Args:
+            img_rgb (np.ndarray): Frame RGB untuk inferensi.
+
+        Returns:
+            bool: True jika inferensi perlu dijalankan ulang.
+        """
+        small = cv2.cvtColor(
+            cv2.resize(img_rgb, self.MOTION_SIZE, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_RGB2GRAY
+        )
+        if self._prev_small is not None and self._skipped_frames < self.MOTION_MAX_SKIPPED:
+            changed = np.count_nonzero(cv2.absdiff(small, self._prev_small) > self.MOTION_PIXEL_DIFF)
+            if changed < self.MOTION_MIN_CHANGED * small.size:
+                self._skipped_frames += 1
+                return False
+        self._prev_small = small
+        self._skipped_frames = 0
+        return True
 
     def run(self):
         """
@@ -133,62 +483,115 @@ class GestureRecognitionApp:
             print("Error: Tidak dapat mengakses webcam.")
             return
 
+        # Minta format MJPEG dengan resolusi dan FPS sedang agar bandwidth USB dan
+        # biaya decode per frame lebih kecil (diabaikan jika webcam tidak mendukung)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_FPS, 30)
+
+        # Batasi buffer driver agar frame yang diproses selalu yang terbaru
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Jalankan capture webcam di thread terpisah
+        grabber = FrameGrabber(cap)
+        grabber.start()
+
+        # Simpan fungsi/konstanta yang dipakai tiap frame di variabel lokal
+        FONT = cv2.FONT_HERSHEY_SIMPLEX
+        FILL = cv2.FILLED
+        SRGB = mp.ImageFormat.SRGB
+        KEY_QUIT = ord('q')
+        _put_text = cv2.putText
+        _rect = cv2.rectangle
+        _imshow = cv2.imshow
+        _wait_key = cv2.waitKey
+        _mp_image = mp.Image
+        _resize = cv2.resize
+        INTER_AREA = cv2.INTER_AREA
+        detect_async = self.landmarker.detect_async
+        enable_face = self.enable_face
+        if enable_face:
+            process_faces = self.face_detection.process
+
+        # Pengaturan teks nama gesture
+        max_width = self.TEXT_MAX_WIDTH
+        font_scale = self.TEXT_FONT_SCALE
+        thickness = self.TEXT_THICKNESS
+        line_height = self.TEXT_LINE_HEIGHT
+
         print("Program berjalan... Tekan 'q' untuk keluar.")
 
         while True:
-            success, img = cap.read()
-            if not success:
+            frame = grabber.read()
+            if frame is None:
                 print("Gagal membaca frame dari webcam.")
                 break
 
-            # Flip gambar secara horizontal agar seperti cermin (opsional, tapi lebih natural)
-            img = cv2.flip(img, 1)
+            img, img_rgb = frame
             
-            # Konversi BGR ke RGB karena MediaPipe membutuhkan input RGB
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            
-            h, w, c = img.shape
+            h, w = img.shape[:2]
+
+            # Jika frame hampir sama dengan frame terakhir yang diproses,
+            # lewati inferensi dan pakai ulang hasil sebelumnya (lihat `_has_motion`).
+            if self._has_motion(img_rgb):
+                # Kirim frame ke HandLandmarker; hasilnya datang lewat `_on_hands`
+                # sementara deteksi wajah berjalan di thread ini.
+                mp_image = _mp_image(image_format=SRGB, data=img_rgb)
+                detect_async(mp_image, self._next_timestamp_ms())
+
+                if enable_face:
+                    # Perkecil lagi khusus untuk deteksi wajah (rasio aspek dipertahankan)
+                    rh, rw = img_rgb.shape[:2]
+                    face_size = (self.FACE_INFERENCE_WIDTH, round(rh * self.FACE_INFERENCE_WIDTH / rw))
+                    self._face_results = process_faces(_resize(img_rgb, face_size, interpolation=INTER_AREA))
 
             # ==================================================================
             # 1. DETEKSI WAJAH (FACE DETECTION)
             # ==================================================================
-            face_results = self.face_detection.process(img_rgb)
+            face_results = self._face_results
             
-            if face_results.detections:
+            if face_results is not None and face_results.detections:
                 for detection in face_results.detections:
                     # Menggambar bounding box wajah
                     # MediaPipe mengembalikan koordinat relatif (0.0 - 1.0), perlu dikali dimensi gambar
                     bboxC = detection.location_data.relative_bounding_box
-                    ih, iw, _ = img.shape
-                    x, y, w_box, h_box = int(bboxC.xmin * iw), int(bboxC.ymin * ih), \
-                                         int(bboxC.width * iw), int(bboxC.height * ih)
+                    x, y, w_box, h_box = int(bboxC.xmin * w), int(bboxC.ymin * h), \
+                                         int(bboxC.width * w), int(bboxC.height * h)
                     
                     # Gambar kotak di sekitar wajah
-                    cv2.rectangle(img, (x, y), (x + w_box, y + h_box), (255, 0, 255), 2)
-                    cv2.putText(img, 'Face', (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 255), 2)
+                    _rect(img, (x, y), (x + w_box, y + h_box), (255, 0, 255), 2)
+                    _put_text(img, 'Face', (x, y - 10), FONT, 0.5, (255, 0, 255), 2)
 
             # ==================================================================
             # 2. DETEKSI TANGAN (HAND DETECTION)
             # ==================================================================
-            hand_results = self.hands.process(img_rgb)
+            # Pakai hasil terbaru yang sudah tersedia (bisa dari frame sebelumnya)
+            hand_results = self._hand_result
 
-            if hand_results.multi_hand_landmarks:
+            if hand_results is not None and hand_results.hand_landmarks:
+                hands = []
                 # Loop untuk setiap tangan yang terdeteksi
-                for hand_idx, hand_landmarks in enumerate(hand_results.multi_hand_landmarks):
+                for hand_idx, hand_landmarks in enumerate(hand_results.hand_landmarks):
                     
                     # Dapatkan label tangan (Left/Right)
                     # Note: index classification sesuai urutan deteksi
                     handedness_label = "Right" # Default
-                    if hand_results.multi_handedness:
+                    if hand_results.handedness:
                         # Mengambil label dari hasil klasifikasi
-                        handedness = hand_results.multi_handedness[hand_idx].classification[0].label
+                        handedness = hand_results.handedness[hand_idx][0].category_name
                         handedness_label = handedness
 
-                    # Gambar landmarks tangan di layar
-                    self.mp_draw.draw_landmarks(img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+                    # Salin koordinat landmarks sekali per tangan
+                    hands.append((self.landmarks_to_array(hand_landmarks, w, h), handedness_label))
 
-                    # Hitung status jari [1, 0, 1, ...]
-                    fingers_status = self.detect_fingers(hand_landmarks, handedness_label)
+                # Gambar landmarks semua tangan sekaligus (sebelum teks agar teks tetap di atas)
+                if self.draw_landmarks:
+                    self.draw_hands(img, [lm for lm, _ in hands])
+
+                for lm, handedness_label in hands:
+                    # Hitung status jari sebagai integer 5-bit (contoh 0b10100)
+                    fingers_status = self.detect_fingers(lm, handedness_label)
                     
                     # Dapatkan nama gesture berdasarkan status jari
                     gesture_text = self.detect_gesture(fingers_status)
@@ -198,36 +601,17 @@ class GestureRecognitionApp:
                     # ==========================================================
                     # Koordinat untuk menampilkan teks (di dekat tangan atau pojok layar)
                     # Kita ambil posisi pergelangan tangan (landmark 0) untuk posisi teks
-                    wrist = hand_landmarks.landmark[0]
-                    cx, cy = int(wrist.x * w), int(wrist.y * h)
+                    cx, cy = lm[0].tolist()
 
                     # Tampilkan Status Jari (Debug info)
-                    status_str = str(fingers_status)
-                    cv2.putText(img, status_str, (cx, cy + 30), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+                    if self.debug:
+                        _put_text(img, self._dbg_strs[fingers_status], (cx, cy + 30), 
+                                  FONT, 0.6, (0, 255, 255), 2)
 
                     # Tampilkan Nama Gesture (Hasil Utama) dengan Text Wrapping
-                    max_width = 200  # Lebar maksimum teks sebelum turun baris
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 0.8
-                    thickness = 2
-                    
-                    words = gesture_text.split(' ')
-                    lines = []
-                    current_line = ""
-                    
-                    for word in words:
-                        test_line = current_line + word + " "
-                        (text_w, text_h), _ = cv2.getTextSize(test_line, font, font_scale, thickness)
-                        if text_w > max_width and current_line != "":
-                            lines.append(current_line)
-                            current_line = word + " "
-                        else:
-                            current_line = test_line
-                    lines.append(current_line)
+                    lines = self._wrap(gesture_text)
 
                     # Hitung tinggi kotak background
-                    line_height = 30
                     box_height = len(lines) * line_height
                     
                     # Koordinat kotak (tumbuh ke atas dari posisi awal)
@@ -237,21 +621,23 @@ class GestureRecognitionApp:
                     box_x2 = box_x1 + max_width + 30
 
                     # Gambar background hitam
-                    cv2.rectangle(img, (box_x1, box_y1), (box_x2, box_y2), (0, 0, 0), cv2.FILLED)
+                    _rect(img, (box_x1, box_y1), (box_x2, box_y2), (0, 0, 0), FILL)
 
                     # Gambar teks per baris
                     for i, line in enumerate(lines):
                         y_pos = box_y1 + 30 + (i * line_height)
-                        cv2.putText(img, line.strip(), (box_x1 + 10, y_pos - 5), 
-                                    font, font_scale, (0, 255, 0), thickness)
+                        _put_text(img, line, (box_x1 + 10, y_pos - 5), 
+                                  FONT, font_scale, (0, 255, 0), thickness)
 
             # Tampilkan frame akhir
-            cv2.imshow("Gesture & Face Recognition System", img)
+            _imshow("Gesture & Face Recognition System", img)
 
             # Tekan 'q' untuk keluar
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            if _wait_key(1) & 0xFF == KEY_QUIT:
                 break
 
+        grabber.stop()
+        self.landmarker.close()
         cap.release()
         cv2.destroyAllWindows()
 